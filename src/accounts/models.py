@@ -1,6 +1,6 @@
+import secrets
 import uuid
 from datetime import timedelta
-from random import randint
 
 from asgiref.sync import sync_to_async
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
@@ -162,7 +162,7 @@ class ConfirmationCode(models.Model):
     async def generate(cls, user: Account):
         code, _ = await ConfirmationCode.objects.aupdate_or_create(
             user=user,
-            defaults={"code": randint(100_000, 999_999)},
+            defaults={"code": secrets.randbelow(900_000) + 100_000},
         )
 
         return code
@@ -1,6 +1,7 @@
 import logging
 import random
 import uuid
+from itertools import chain
 from typing import Annotated, List
 
 from asgiref.sync import sync_to_async
@@ -18,7 +19,7 @@ from resumes.models import Resume
 from resumes.schemas import ResumeSchema, TeamWithResumesSchema
 from teams.models import Team
 from teams.schemas import EmailSchema, TeamSchema
-from utils.notification import send_notification
+from utils.notification import schedule_notification, send_notification
 
 from .models import Hackathon, Role
 from .schemas import (
@@ -30,7 +31,13 @@ from .schemas import (
     HackathonSummarySchema,
     NotificationStatusSchema,
 )
-from .services import get_emails_from_csv, make_csv
+from .services import (
+    add_emails_to_hackathon,
+    get_cached_hackathon_or_404,
+    get_emails_from_csv,
+    get_hackathon_or_404,
+    make_csv,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,15 +77,12 @@ async def create_hackathon(
     for role in body.roles:
         await hackathon.roles.acreate(name=role)
 
-    participants = set(body.participants)
+    participants = body.participants
     if csv_emails is not None:
         csv_participants = get_emails_from_csv(file=csv_emails)
-        participants |= set(csv_participants)
-
-    for participant in participants:
-        email_obj, created = await Email.objects.aget_or_create(email=participant)
+        participants = chain(participants, csv_participants)
 
-        await hackathon.emails.aadd(email_obj)
+    await add_emails_to_hackathon(hackathon=hackathon, emails=participants)
 
     return 201, await hackathon.to_entity()
 
@@ -92,10 +96,8 @@ async def join_hackathon(
     role_name: Annotated[str | None, Query(alias="role")] = None,
 ):
     user = request.user
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"),
-        id=hackathon_id,
-        status=Hackathon.Status.STARTED,
+    hackathon = await get_hackathon_or_404(
+        id=hackathon_id, status=Hackathon.Status.STARTED
     )
     if not await hackathon.emails.filter(email=user.email).aexists():
         return 403, ErrorSchema(
@@ -120,12 +122,12 @@ async def join_hackathon(
 async def send_invites(
     request: APIRequest, hackathon_id: uuid.UUID, emails_schema: EmailsSchema
 ):
-    hackathon = await aget_object_or_404(Hackathon, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
 
     if hackathon.creator_id != request.user.id:
         return 403, ErrorSchema(detail="You are not creator")
 
-    await send_notification(
+    schedule_notification(
         emails=hackathon.emails.filter(email__in=emails_schema.emails),
         context={"hackathon": hackathon},
         mail_template="hackathons/mail/invitation_to_hackathon.html",
@@ -143,11 +145,9 @@ async def add_user_to_hackathon(
     request: APIRequest, hackathon_id: uuid.UUID, email_schema: EmailSchema
 ):
     user = request.user
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=hackathon_id
-    )
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
 
-    if hackathon.creator != user:
+    if hackathon.creator_id != user.id:
         return 403, ErrorSchema(
             detail="You are not creator and you can not edit this hackathon"
         )
@@ -169,14 +169,12 @@ async def remove_user_from_hackathon(
     request: APIRequest, hackathon_id: uuid.UUID, email_schema: EmailSchema
 ):
     user = request.user
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=hackathon_id
-    )
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
     user_to_remove = await aget_object_or_404(
-        Hackathon.participants, user__email=email_schema.email
+        hackathon.participants, email=email_schema.email
     )
 
-    if hackathon.creator != user:
+    if hackathon.creator_id != user.id:
         return 403, ErrorSchema(
             detail="You are not creator and you can not edit this hackathon"
         )
@@ -203,23 +201,27 @@ async def edit_hackathons(
     request: APIRequest, id: uuid.UUID, edit_schema: HackathonEditSchema
 ):
     user = request.user
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=id
-    )
-    if hackathon.creator != user:
+    hackathon = await get_hackathon_or_404(id=id)
+    if hackathon.creator_id != user.id:
         return 403, ErrorSchema(
             detail="You are not creator and you can not edit this hackathon"
         )
 
+    update_fields = []
     if edit_schema.name:
         hackathon.name = edit_schema.name
+        update_fields.append("name")
     if edit_schema.description:
         hackathon.description = edit_schema.description
+        update_fields.append("description")
     if edit_schema.min_participants:
         hackathon.min_participants = edit_schema.min_participants
+        update_fields.append("min_participants")
     if edit_schema.max_participants:
         hackathon.max_participants = edit_schema.max_participants
-    await hackathon.asave()
+        update_fields.append("max_participants")
+    if update_fields:
+        await hackathon.asave(update_fields=update_fields)
     return 200, await hackathon.to_entity()
 
 
@@ -231,16 +233,14 @@ async def change_photo(
     request: APIRequest, id: uuid.UUID, image_cover: UploadedFile = File(...)
 ):
     user = request.user
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=id
-    )
-    if hackathon.creator != user:
+    hackathon = await get_hackathon_or_404(id=id)
+    if hackathon.creator_id != user.id:
         return 403, ErrorSchema(
             detail="You are not creator and you can not edit this hackathon"
         )
 
     hackathon.image_cover = image_cover.read()
-    await hackathon.asave()
+    await hackathon.asave(update_fields=["image_cover"])
 
     return 200, await hackathon.to_entity()
 
@@ -252,9 +252,7 @@ async def change_photo(
 async def get_specific_hackathon(
     request: APIRequest, id: uuid.UUID
 ) -> tuple[int, Hackathon]:
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=id
-    )
+    hackathon = await get_cached_hackathon_or_404(hackathon_id=id)
     return 200, await hackathon.to_entity()
 
 
@@ -266,6 +264,7 @@ async def list_my_hackathons(request: APIRequest):
     hackathons_queryset = (
         Hackathon.objects.filter(Q(creator=user) | Q(participants=user))
         .select_related("creator")
+        .prefetch_related("participants", "emails", "roles")
         .distinct()
     )
     hackathons = [
@@ -281,7 +280,11 @@ async def list_my_hackathons(request: APIRequest):
 )
 async def get_user_team_in_hackathon(request: APIRequest, id: uuid.UUID):
     user = request.user
-    team = await aget_object_or_404(Team, hackathon_id=id, team_members=user)
+    team = await aget_object_or_404(
+        Team.objects.select_related("creator").prefetch_related("team_members"),
+        hackathon_id=id,
+        team_members=user,
+    )
 
     return 200, await team.to_entity()
 
@@ -294,23 +297,16 @@ async def upload_emails_to_hackathon(
     request: APIRequest, hackathon_id: uuid.UUID, csv_file: UploadedFile = File(...)
 ):
     user = request.user
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=hackathon_id
-    )
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
 
-    if hackathon.creator != user:
+    if hackathon.creator_id != user.id:
         return 403, ErrorSchema(
             detail="You are not the creator and can not edit this hackathon"
         )
 
     try:
         emails = get_emails_from_csv(file=csv_file)
-        for email in emails:
-            email_obj, created = await Email.objects.aget_or_create(email=email)
-
-            await hackathon.emails.aadd(email_obj)
-
-        await hackathon.asave()
+        await add_emails_to_hackathon(hackathon=hackathon, emails=emails)
 
     except Exception as e:
         logger.critical(f"Failed to process CSV file: {str(e)}")
@@ -325,7 +321,7 @@ async def upload_emails_to_hackathon(
 )
 async def export_participants_hackathon(request: APIRequest, hackathon_id: uuid.UUID):
     user = request.user
-    hackathon = await aget_object_or_404(Hackathon.objects, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
 
     if hackathon.creator_id != user.id:
         return 403, ErrorSchema(
@@ -346,18 +342,16 @@ async def export_participants_hackathon(request: APIRequest, hackathon_id: uuid.
     response={200: StatusSchema, ERROR_CODES: ErrorSchema},
 )
 async def start_hackathon(request: APIRequest, hackathon_id: uuid.UUID):
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=hackathon_id
-    )
-    if hackathon.creator != request.user:
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
+    if hackathon.creator_id != request.user.id:
         return 403, ErrorSchema(
             detail="You are not the creator or cannot edit this hackathon"
         )
 
     hackathon.status = Hackathon.Status.STARTED
-    await hackathon.asave()
+    await hackathon.asave(update_fields=["status"])
 
-    await send_notification(
+    schedule_notification(
         emails=hackathon.emails.all(),
         context={"hackathon": hackathon},
         mail_template="hackathons/mail/invitation_to_hackathon.html",
@@ -372,18 +366,16 @@ async def start_hackathon(request: APIRequest, hackathon_id: uuid.UUID):
     response={200: StatusSchema, ERROR_CODES: ErrorSchema},
 )
 async def end_hackathon(request: APIRequest, hackathon_id: uuid.UUID):
-    hackathon = await aget_object_or_404(
-        Hackathon.objects.select_related("creator"), id=hackathon_id
-    )
-    if hackathon.creator != request.user:
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
+    if hackathon.creator_id != request.user.id:
         return 403, ErrorSchema(
             detail="You are not the creator or cannot edit this hackathon"
         )
 
     hackathon.status = Hackathon.Status.ENDED
-    await hackathon.asave()
+    await hackathon.asave(update_fields=["status"])
 
-    await send_notification(
+    schedule_notification(
         emails=hackathon.emails.all(),
         context={"hackathon": hackathon},
         mail_template="hackathons/mail/hackathon_ended.html",
@@ -400,7 +392,7 @@ async def end_hackathon(request: APIRequest, hackathon_id: uuid.UUID):
 async def analytics(
     request: APIRequest, hackathon_id: uuid.UUID
 ) -> tuple[int, AnalyticsSchema | ErrorSchema]:
-    hackathon = await aget_object_or_404(Hackathon, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
     if hackathon.creator_id != request.user.id:
         return 403, ErrorSchema(detail="You are not the creator")
 
@@ -422,7 +414,7 @@ async def analytics(
     response={200: HackathonSummarySchema, ERROR_CODES: ErrorSchema},
 )
 async def hackathon_summary(request: APIRequest, hackathon_id: uuid.UUID):
-    hackathon = await aget_object_or_404(Hackathon, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
     if hackathon.creator_id != request.user.id:
         return 403, ErrorSchema(detail="You are not the creator")
 
@@ -470,7 +462,7 @@ async def hackathon_summary(request: APIRequest, hackathon_id: uuid.UUID):
     response={200: list[ResumeSchema], ERROR_CODES: ErrorSchema},
 )
 async def get_participants_without_team(request: APIRequest, hackathon_id: uuid.UUID):
-    hackathon = await aget_object_or_404(Hackathon, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
     if hackathon.creator_id != request.user.id:
         return 403, ErrorSchema(detail="You are not the creator")
 
@@ -490,7 +482,7 @@ async def get_participants_without_team(request: APIRequest, hackathon_id: uuid.
     response={200: list[NotificationStatusSchema], ERROR_CODES: ErrorSchema},
 )
 async def pending_invitations(request: APIRequest, hackathon_id: uuid.UUID):
-    hackathon = await aget_object_or_404(Hackathon, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
     if hackathon.creator_id != request.user.id:
         return 403, ErrorSchema(detail="You are not the creator")
 
@@ -530,7 +522,7 @@ async def create_teams_by_emails(
     request: APIRequest, hackathon_id: uuid.UUID, emails_schema: EmailsSchema
 ):
     user = request.user
-    hackathon = await aget_object_or_404(Hackathon, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
 
     if hackathon.creator_id != user.id:
         return 403, ErrorSchema(detail="You are not the creator")
@@ -543,7 +535,7 @@ async def create_teams_by_emails(
             detail=f"Cannot create team with more than {hackathon.max_participants} participants"
         )
 
-    email_objs = await sync_to_async(list)(Email.objects.filter(email__in=emails))
+    email_objs = await sync_to_async(list)(hackathon.emails.filter(email__in=emails))
 
     if not email_objs:
         return 400, ErrorSchema(detail="No matching emails found in the hackathon")
@@ -581,7 +573,7 @@ async def create_teams_by_emails(
             await new_team.team_members.aadd(participant)
             list_of_users.append(participant)
     if list_of_users:
-        await send_notification(
+        schedule_notification(
             users=list_of_users,
             context={
                 "hackathon": hackathon,
@@ -600,7 +592,7 @@ async def create_teams_by_emails(
     response={200: List[TeamWithResumesSchema], ERROR_CODES: ErrorSchema},
 )
 async def get_hand_created_teams(request: APIRequest, hackathon_id: uuid.UUID):
-    hackathon = await aget_object_or_404(Hackathon, id=hackathon_id)
+    hackathon = await get_hackathon_or_404(id=hackathon_id)
 
     hand_created_teams = Team.objects.filter(hackathon=hackathon, is_hand_create=True)
 
@@ -1,19 +1,83 @@
 import csv
-from io import StringIO
-
+import uuid
+from io import StringIO, TextIOWrapper
+from itertools import batched
+from typing import Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import transaction
+from django.shortcuts import aget_object_or_404
 from ninja import UploadedFile
 
-from hackathons.models import UserRole
+from accounts.models import Email
+from hackathons.models import Hackathon, UserRole
 from resumes.models import Resume
 from teams.models import Team
 
+EMAILS_BATCH_SIZE = 1000
+HACKATHON_CACHE_TTL = 10  # seconds
+
+
+async def get_hackathon_or_404(**kwargs) -> Hackathon:
+    return await aget_object_or_404(
+        Hackathon.objects.select_related("creator"), **kwargs
+    )
+
+
+def get_hackathon_cache_key(hackathon_id: uuid.UUID) -> str:
+    return f"hackathon:{hackathon_id}"
+
+
+async def get_cached_hackathon_or_404(hackathon_id: uuid.UUID) -> Hackathon:
+    cache_key = get_hackathon_cache_key(hackathon_id)
+
+    hackathon = await cache.aget(cache_key)
+    if hackathon is None:
+        hackathon = await get_hackathon_or_404(id=hackathon_id)
+        await cache.aset(cache_key, hackathon, timeout=HACKATHON_CACHE_TTL)
+
+    return hackathon
+
 
-def get_emails_from_csv(file: UploadedFile) -> list[str]:
-    file_data = file.read().decode("utf-8-sig")
-    csv_reader = csv.reader(StringIO(file_data), delimiter=",")
-    emails = [row[0].strip() for row in csv_reader if row]
+def get_emails_from_csv(file: UploadedFile) -> Iterator[str]:
+    text_file = TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        for row in csv.reader(text_file, delimiter=","):
+            email = row[0].strip() if row else ""
+            if email:
+                yield email
+    finally:
+        # do not let the wrapper close the uploaded file
+        text_file.detach()
 
-    return emails
+
+async def add_emails_to_hackathon(hackathon: Hackathon, emails: Iterable[str]) -> None:
+    # emails may be a lazy CSV stream, so a parse error can happen after
+    # earlier batches were written; import everything in one transaction
+    await sync_to_async(_add_emails_to_hackathon)(hackathon=hackathon, emails=emails)
+
+
+def _add_emails_to_hackathon(hackathon: Hackathon, emails: Iterable[str]) -> None:
+    with transaction.atomic():
+        for batch in batched(emails, EMAILS_BATCH_SIZE):
+            _add_emails_batch(hackathon=hackathon, emails=set(batch))
+
+
+def _add_emails_batch(hackathon: Hackathon, emails: set[str]) -> None:
+    Email.objects.bulk_create(
+        [Email(email=email) for email in emails], ignore_conflicts=True
+    )
+    email_ids = Email.objects.filter(email__in=emails).values_list("id", flat=True)
+
+    HackathonEmail = Hackathon.emails.through
+    HackathonEmail.objects.bulk_create(
+        [
+            HackathonEmail(hackathon_id=hackathon.id, email_id=email_id)
+            for email_id in email_ids
+        ],
+        ignore_conflicts=True,
+    )
 
 
 async def make_csv(hackathon) -> str:
@@ -24,31 +88,28 @@ async def make_csv(hackathon) -> str:
 
     teams = Team.objects.filter(hackathon=hackathon).prefetch_related("team_members")
 
+    githubs = {
+        user_id: github
+        async for user_id, github in Resume.objects.filter(
+            hackathon=hackathon
+        ).values_list("user_id", "github")
+    }
+    roles = {
+        user_id: role_name
+        async for user_id, role_name in UserRole.objects.filter(
+            hackathon=hackathon
+        ).values_list("user_id", "role__name")
+    }
+
     async for team in teams:
         async for participant in team.team_members.all():
-            try:
-                resume = await Resume.objects.aget(
-                    user=participant, hackathon=hackathon
-                )
-                github = resume.github or "N/A"
-            except Resume.DoesNotExist:
-                github = "N/A"
-
-            try:
-                user_role = await UserRole.objects.select_related("role").aget(
-                    user=participant, hackathon=hackathon
-                )
-                role = user_role.role.name
-            except UserRole.DoesNotExist:
-                role = "N/A"
-
             csv_writer.writerow(
                 [
                     team.name,
                     participant.email,
                     participant.username,
-                    github,
-                    role,
+                    githubs.get(participant.id) or "N/A",
+                    roles.get(participant.id, "N/A"),
                 ]
             )
 
@@ -56,27 +117,13 @@ async def make_csv(hackathon) -> str:
         id__in=teams.values_list("team_members__id", flat=True)
     )
     async for participant in participants_without_team:
-        try:
-            resume = await Resume.objects.aget(user=participant, hackathon=hackathon)
-            github = resume.github or "N/A"
-        except Resume.DoesNotExist:
-            github = "N/A"
-
-        try:
-            user_role = await UserRole.objects.select_related("role").aget(
-                user=participant, hackathon=hackathon
-            )
-            role = user_role.role.name
-        except UserRole.DoesNotExist:
-            role = "N/A"
-
         csv_writer.writerow(
             [
                 "No Team",
                 participant.email,
                 participant.username,
-                github,
-                role,
+                githubs.get(participant.id) or "N/A",
+                roles.get(participant.id, "N/A"),
             ]
         )
 
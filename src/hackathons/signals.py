@@ -0,0 +1,11 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Hackathon
+from .services import get_hackathon_cache_key
+
+
+@receiver([post_save, post_delete], sender=Hackathon)
+def invalidate_hackathon_cache(sender, instance: Hackathon, **kwargs) -> None:
+    cache.delete(get_hackathon_cache_key(instance.id))
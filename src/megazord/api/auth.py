@@ -57,11 +57,11 @@ class AuthBearer(HttpBearer):
 def create_jwt(
     user_id: uuid.UUID, expires_delta: timedelta = timedelta(weeks=4)
 ) -> str:
-    expire = datetime.now(timezone.utc) + expires_delta
+    now = datetime.now(timezone.utc)
     jwt_data = {
         "user_id": str(user_id),
-        "iat": datetime.now(timezone.utc).timestamp(),
-        "exp": expire,
+        "iat": now.timestamp(),
+        "exp": now + expires_delta,
     }
     token = jwt.encode(payload=jwt_data, key=SECRET_KEY, algorithm=JWT_ALGORITHM)
 
@@ -1,5 +1,5 @@
+import time
 import uuid
-from datetime import datetime
 from typing import List, Optional
 
 import jwt
@@ -105,8 +105,8 @@ async def add_user_to_team(
 ):
     user = request.user
 
-    team = await aget_object_or_404(Team.objects.select_related("creator"), id=team_id)
-    if team.creator != user:
+    team = await aget_object_or_404(Team, id=team_id)
+    if team.creator_id != user.id:
         return 403, ErrorSchema(
             detail="You are not creator and you can not edit this hackathon"
         )
@@ -123,7 +123,7 @@ async def add_user_to_team(
 
     encoded_jwt = jwt.encode(
         {
-            "createdAt": datetime.now().timestamp(),
+            "createdAt": time.time(),
             "id": str(team.id),
             "email": user_to_add.email,
         },
@@ -183,13 +183,12 @@ async def remove_user_from_team(
 async def join_team(request: APIRequest, team_id: uuid.UUID, token: str):
     user = request.user
 
-    tkn = await aget_object_or_404(Token, token=token)
-    if not tkn.is_active:
+    deactivated = await Token.objects.filter(token=token, is_active=True).aupdate(
+        is_active=False
+    )
+    if not deactivated:
         return 403, ErrorSchema(detail="token in not active")
 
-    tkn.is_active = False
-    await tkn.asave()
-
     team = await aget_object_or_404(
         Team.objects.select_related("hackathon"), id=team_id
     )
@@ -223,7 +222,7 @@ async def leave_team(request: APIRequest, team_id: uuid.UUID):
         await team.adelete()
         return 200, StatusSchema()
 
-    if team.creator == request.user:
+    if team.creator_id == request.user.id:
         team.creator = await team.team_members.afirst()
         await team.asave()
 
@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-15 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("teams", "0002_team_is_hand_create"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="token",
+            name="token",
+            field=models.CharField(max_length=2048, unique=True),
+        ),
+    ]
@@ -27,7 +27,8 @@ class Team(models.Model):
 
         members_entities = [
             await member.to_entity()
-            async for member in self.team_members.exclude(id=self.creator_id)
+            async for member in self.team_members.all()
+            if member.id != self.creator_id
         ]
         logger.info(f"Members entities: {members_entities}")
         return TeamEntity(
@@ -41,5 +42,5 @@ class Team(models.Model):
 
 class Token(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
-    token = models.CharField(max_length=2048)
+    token = models.CharField(max_length=2048, unique=True)
     is_active = models.BooleanField()
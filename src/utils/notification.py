@@ -1,10 +1,12 @@
 import asyncio
 import logging
-from smtplib import SMTPException
+from contextlib import nullcontext
+from smtplib import SMTPException, SMTPServerDisconnected
 from typing import Any, Sequence
 
 from aiolimiter import AsyncLimiter
 from asgiref.sync import sync_to_async
+from django.core.mail import get_connection
 from django.core.mail.backends.base import BaseEmailBackend
 from django.db.models import QuerySet
 from django.template.loader import render_to_string
@@ -20,8 +22,29 @@ logger = logging.getLogger(__name__)
 
 limiter = AsyncLimiter(max_rate=30, time_period=1.0)
 
+TELEGRAM_SEND_MESSAGE_URL = (
+    f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+)
+
 type Recipient[T] = Sequence[T] | QuerySet[T] | T
 
+background_tasks: set[asyncio.Task] = set()
+
+
+def schedule_notification(**kwargs: Any) -> asyncio.Task:
+    task = asyncio.create_task(send_notification(**kwargs))
+    background_tasks.add(task)
+    task.add_done_callback(_on_notification_done)
+
+    return task
+
+
+def _on_notification_done(task: asyncio.Task) -> None:
+    background_tasks.discard(task)
+
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Failed sent notification", exc_info=task.exception())
+
 
 async def send_notification(
     users: Recipient[Account] | None = None,
@@ -48,6 +71,40 @@ async def send_notification(
         }
     )
 
+    connection = None
+    if mail_template is not None:
+        connection = await open_mail_connection()
+
+    telegram_client = None
+    if telegram_template is not None:
+        telegram_client = AsyncClient()
+
+    try:
+        await _send_notification(
+            users=users,
+            emails=emails,
+            context=context,
+            mail_template=mail_template,
+            telegram_template=telegram_template,
+            connection=connection,
+            telegram_client=telegram_client,
+        )
+    finally:
+        if connection is not None:
+            await sync_to_async(connection.close)()
+        if telegram_client is not None:
+            await telegram_client.aclose()
+
+
+async def _send_notification(
+    users: Recipient[Account] | None,
+    emails: Recipient[Email] | None,
+    context: dict[str, Any],
+    mail_template: str | None,
+    telegram_template: str | None,
+    connection: BaseEmailBackend | None,
+    telegram_client: AsyncClient | None,
+):
     if users is not None:
         if isinstance(users, QuerySet):
             users = [user async for user in users]
@@ -59,6 +116,8 @@ async def send_notification(
             context=context,
             mail_template=mail_template,
             telegram_template=telegram_template,
+            connection=connection,
+            telegram_client=telegram_client,
         )
 
     if emails is not None:
@@ -72,6 +131,8 @@ async def send_notification(
             context=context,
             mail_template=mail_template,
             telegram_template=telegram_template,
+            connection=connection,
+            telegram_client=telegram_client,
         )
 
 
@@ -80,21 +141,28 @@ async def send_notification_by_email(
     context: dict[str, Any],
     mail_template: str | None = None,
     telegram_template: str | None = None,
+    connection: BaseEmailBackend | None = None,
+    telegram_client: AsyncClient | None = None,
 ):
+    accounts = {
+        account.email: account
+        async for account in Account.objects.filter(
+            email__in=[email.email for email in emails]
+        )
+    }
+
     for email in emails:
         email_sent = True
         telegram_sent = True
-        try:
-            user = await Account.objects.aget(email=email)
-            context["current_user"] = user
-        except Account.DoesNotExist:
-            user = None
+        user = accounts.get(email.email)
+        context["current_user"] = user
 
         if mail_template is not None:
             email_sent = await send_email(
                 template_name=mail_template,
                 context=context,
                 recipient_list=[email.email],
+                connection=connection,
             )
 
         if (
@@ -106,6 +174,7 @@ async def send_notification_by_email(
                 template_name=telegram_template,
                 context=context,
                 chat_id=user.telegram_id,
+                client=telegram_client,
             )
 
         await process_notification_status(
@@ -118,6 +187,8 @@ async def send_notification_by_user(
     context: dict[str, Any],
     mail_template: str | None = None,
     telegram_template: str | None = None,
+    connection: BaseEmailBackend | None = None,
+    telegram_client: AsyncClient | None = None,
 ):
     for user in users:
         context["current_user"] = user
@@ -129,6 +200,7 @@ async def send_notification_by_user(
                 template_name=mail_template,
                 context=context,
                 recipient_list=[user.email],
+                connection=connection,
             )
 
         if telegram_template is not None and user.telegram_id is not None:
@@ -136,6 +208,7 @@ async def send_notification_by_user(
                 template_name=telegram_template,
                 context=context,
                 chat_id=user.telegram_id,
+                client=telegram_client,
             )
 
         await process_notification_status(
@@ -143,6 +216,17 @@ async def send_notification_by_user(
         )
 
 
+async def open_mail_connection() -> BaseEmailBackend:
+    connection = get_connection()
+    try:
+        await sync_to_async(connection.open)()
+    except (SMTPException, OSError) as exc:
+        # each message will try to open its own connection
+        logger.error(f"Failed open email connection: {exc}")
+
+    return connection
+
+
 async def send_email(
     template_name: str,
     context: dict[str, Any],
@@ -155,7 +239,7 @@ async def send_email(
 ) -> bool:
     logger.info(f"Sending email to `{recipient_list}`")
 
-    try:
+    async def send() -> None:
         await sync_to_async(send_mail_sync)(
             template_name=template_name,
             context=context,
@@ -166,25 +250,40 @@ async def send_email(
             auth_password=auth_password,
             connection=connection,
         )
-    except SMTPException as exc:
+
+    try:
+        try:
+            await send()
+        except SMTPServerDisconnected:
+            if connection is None:
+                raise
+
+            # shared connection was dropped by server, reconnect and retry once
+            logger.warning("Email connection closed by server, reconnecting")
+            await sync_to_async(connection.close)()
+            await sync_to_async(connection.open)()
+            await send()
+    except (SMTPException, OSError) as exc:
         logger.error(f"Failed sent email to `{recipient_list}`: {exc}")
         return False
     return True
 
 
 async def send_telegram_message(
-    template_name: str, context: dict[str, Any], chat_id: int
+    template_name: str,
+    context: dict[str, Any],
+    chat_id: int,
+    client: AsyncClient | None = None,
 ) -> bool:
     logger.info(f"Sending telegram message to `{chat_id}`")
 
     message_text = render_to_string(template_name=template_name, context=context)
 
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
     payload = {"chat_id": chat_id, "text": message_text, "parse_mode": "HTML"}
 
     async with limiter:
-        async with AsyncClient() as client:
-            response = await client.post(url=url, json=payload)
+        async with AsyncClient() if client is None else nullcontext(client) as session:
+            response = await session.post(url=TELEGRAM_SEND_MESSAGE_URL, json=payload)
             if response.status_code == 200:
                 logger.info(f"Message sent successfully to `{chat_id}`")
                 return True